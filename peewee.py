@@ -165,6 +165,7 @@ if sys.version_info[0] == 2:
     izip_longest = itertools.izip_longest
     callable_ = callable
     multi_types = (list, tuple, frozenset, set)
+    _intern = lambda s: intern(s) if type(s) is str else s
     exec('def reraise(tp, value, tb=None): raise tp, value, tb')
     def print_(s):
         sys.stdout.write(s)
@@ -185,6 +186,7 @@ else:
     multi_types = (list, tuple, frozenset, set, range)
     print_ = getattr(builtins, 'print')
     izip_longest = itertools.zip_longest
+    _intern = lambda s: sys.intern(s) if type(s) is str else s
     def reraise(tp, value, tb=None):
         if value.__traceback__ is not tb:
             raise value.with_traceback(tb)
@@ -3377,9 +3379,9 @@ class Database(_callable_context_manager):
 
 def __pragma__(name):
     def __get__(self):
-        return self.pragma(name)
+        return self._pragma_get(name)
     def __set__(self, value):
-        return self.pragma(name, value)
+        return self._pragma_set(name, value)
     return property(__get__, __set__)
 
 
@@ -3413,12 +3415,14 @@ class SqliteDatabase(Database):
         self.register_function(_sqlite_date_trunc, 'date_trunc', 2)
         self.nulls_ordering = self.server_version >= (3, 30, 0)
 
-    def init(self, database, pragmas=None, timeout=5, **kwargs):
+    def init(self, database, pragmas=None, timeout=5, isolation_level=None,
+             **kwargs):
         if pragmas is not None:
             self._pragmas = pragmas
         if isinstance(self._pragmas, dict):
             self._pragmas = list(self._pragmas.items())
         self._timeout = timeout
+        self._isolation_level = isolation_level
         super(SqliteDatabase, self).init(database, **kwargs)
 
     def _set_server_version(self, conn):
@@ -3428,7 +3432,8 @@ class SqliteDatabase(Database):
         if sqlite3 is None:
             raise ImproperlyConfigured('SQLite driver not installed!')
         conn = sqlite3.connect(self.database, timeout=self._timeout,
-                               isolation_level=None, **self.connect_params)
+                               isolation_level=self._isolation_level,
+                               **self.connect_params)
         try:
             self._add_conn_hooks(conn)
         except:
@@ -3467,16 +3472,24 @@ class SqliteDatabase(Database):
     def pragma(self, key, value=SENTINEL, permanent=False, schema=None):
         if schema is not None:
             key = '"%s".%s' % (schema, key)
-        sql = 'PRAGMA %s' % key
-        if value is not SENTINEL:
-            sql += ' = %s' % (value or 0)
+        if value is SENTINEL:
             if permanent:
-                pragmas = dict(self._pragmas or ())
-                pragmas[key] = value
-                self._pragmas = list(pragmas.items())
-        elif permanent:
-            raise ValueError('Cannot specify a permanent pragma without value')
-        row = self.execute_sql(sql).fetchone()
+                raise ValueError('Cannot specify a permanent pragma without '
+                                 'value')
+            return self._pragma_get(key)
+        if permanent:
+            pragmas = dict(self._pragmas or ())
+            pragmas[key] = value
+            self._pragmas = list(pragmas.items())
+        return self._pragma_set(key, value)
+
+    def _pragma_get(self, key):
+        row = self.execute_sql('PRAGMA ' + key).fetchone()
+        if row:
+            return row[0]
+
+    def _pragma_set(self, key, value):
+        row = self.execute_sql('PRAGMA %s = %s' % (key, value or 0)).fetchone()
         if row:
             return row[0]
 
@@ -3503,7 +3516,7 @@ class SqliteDatabase(Database):
         if not self.is_closed():
             # PySQLite multiplies user timeout by 1000, but the unit of the
             # timeout PRAGMA is actually milliseconds.
-            self.execute_sql('PRAGMA busy_timeout=%d;' % (seconds * 1000))
+            self._pragma_set('busy_timeout', int(seconds * 1000))
 
     def _load_aggregates(self, conn):
         for name, (klass, num_params) in self._aggregates.items():
@@ -4039,15 +4052,13 @@ class MySQLDatabase(Database):
 
     def get_indexes(self, table, schema=None):
         cursor = self.execute_sql('SHOW INDEX FROM `%s`' % table)
-        unique = set()
-        indexes = {}
-        for row in cursor.fetchall():
-            if not row[1]:
-                unique.add(row[2])
-            indexes.setdefault(row[2], [])
+        rows = cursor.fetchall()
+        unique = set(row[2] for row in rows if not row[1])
+        indexes = collections.defaultdict(list)
+        for row in rows:
             indexes[row[2]].append(row[4])
-        return [IndexMetadata(name, None, indexes[name], name in unique, table)
-                for name in indexes]
+        return [IndexMetadata(name, None, columns, name in unique, table)
+                for name, columns in indexes.items()]
 
     def get_columns(self, table, schema=None):
         sql = """
@@ -4269,6 +4280,9 @@ class _savepoint(_callable_context_manager):
 
 
 class CursorWrapper(object):
+    __slots__ = ('cursor', 'count', 'index', 'initialized', 'populated',
+                 'row_cache')
+
     def __init__(self, cursor):
         self.cursor = cursor
         self.count = 0
@@ -4335,25 +4349,31 @@ class CursorWrapper(object):
         if n < 0:
             raise ValueError('Negative values are not supported.')
 
-        iterator = ResultIterator(self)
-        iterator.index = self.count
         while not self.populated and (n > self.count):
             try:
-                iterator.next()
+                self.iterate()
             except StopIteration:
                 break
 
 
 class DictCursorWrapper(CursorWrapper):
+    __slots__ = ('columns', 'ncols', '_unique_columns')
+
     def _initialize_columns(self):
         description = self.cursor.description
         self.columns = [t[0][t[0].find('.') + 1:].strip('")')
                         for t in description]
         self.ncols = len(description)
+        # Rows can be converted using dict(zip()) when the column names are
+        # unique, otherwise we need to ensure the first value is not
+        # overwritten.
+        self._unique_columns = len(set(self.columns)) == self.ncols
 
     initialize = _initialize_columns
 
     def _row_to_dict(self, row):
+        if self._unique_columns:
+            return dict(zip(self.columns, row))
         result = {}
         for i in range(self.ncols):
             result.setdefault(self.columns[i], row[i])  # Do not overwrite.
@@ -4362,28 +4382,49 @@ class DictCursorWrapper(CursorWrapper):
     process_row = _row_to_dict
 
 
+_row_class_cache = {}
+
+def _row_tuple_class(attributes):
+    # Generating a namedtuple class is relatively expensive, so classes are
+    # shared by all results that have the same attribute names.
+    attributes = tuple(attributes)
+    try:
+        return _row_class_cache[attributes]
+    except KeyError:
+        if len(_row_class_cache) >= 1024:
+            _row_class_cache.clear()
+        tuple_class = collections.namedtuple('Row', attributes)
+        _row_class_cache[attributes] = tuple_class
+        return tuple_class
+
+
 class NamedTupleCursorWrapper(CursorWrapper):
+    __slots__ = ('tuple_class', '_make')
+
     def initialize(self):
         description = self.cursor.description
-        self.tuple_class = collections.namedtuple(
-            'Row',
+        self.tuple_class = _row_tuple_class(
             [col[0][col[0].find('.') + 1:].strip('"') for col in description])
+        self._make = self.tuple_class._make
 
     def process_row(self, row):
-        return self.tuple_class(*row)
+        return self._make(row)
 
 
 class ObjectCursorWrapper(DictCursorWrapper):
+    __slots__ = ('constructor',)
+
     def __init__(self, cursor, constructor):
         super(ObjectCursorWrapper, self).__init__(cursor)
         self.constructor = constructor
 
     def process_row(self, row):
-        row_dict = self._row_to_dict(row)
-        return self.constructor(**row_dict)
+        return self.constructor(**self._row_to_dict(row))
 
 
 class ResultIterator(object):
+    __slots__ = ('cursor_wrapper', 'index')
+
     def __init__(self, cursor_wrapper):
         self.cursor_wrapper = cursor_wrapper
         self.index = 0
@@ -4392,14 +4433,14 @@ class ResultIterator(object):
         return self
 
     def next(self):
-        if self.index < self.cursor_wrapper.count:
-            obj = self.cursor_wrapper.row_cache[self.index]
-        elif not self.cursor_wrapper.populated:
-            self.cursor_wrapper.iterate()
-            obj = self.cursor_wrapper.row_cache[self.index]
+        cursor_wrapper, index = self.cursor_wrapper, self.index
+        if index < cursor_wrapper.count:
+            obj = cursor_wrapper.row_cache[index]
+        elif not cursor_wrapper.populated:
+            obj = cursor_wrapper.iterate()
         else:
             raise StopIteration
-        self.index += 1
+        self.index = index + 1
         return obj
 
     __next__ = next
@@ -4407,6 +4448,8 @@ class ResultIterator(object):
 # FIELDS
 
 class FieldAccessor(object):
+    __slots__ = ('model', 'field', 'name')
+
     def __init__(self, model, field, name):
         self.model = model
         self.field = field
@@ -4423,6 +4466,8 @@ class FieldAccessor(object):
 
 
 class ForeignKeyAccessor(FieldAccessor):
+    __slots__ = ('rel_model',)
+
     def __init__(self, model, field, name):
         super(ForeignKeyAccessor, self).__init__(model, field, name)
         self.rel_model = field.rel_model
@@ -4457,6 +4502,8 @@ class ForeignKeyAccessor(FieldAccessor):
 
 
 class BackrefAccessor(object):
+    __slots__ = ('field', 'model', 'rel_model')
+
     def __init__(self, field):
         self.field = field
         self.model = field.rel_model
@@ -4473,6 +4520,8 @@ class BackrefAccessor(object):
 
 class ObjectIdAccessor(object):
     """Gives direct access to the underlying id"""
+    __slots__ = ('field',)
+
     def __init__(self, field):
         self.field = field
 
@@ -4532,7 +4581,9 @@ class Field(ColumnBase):
         self._sort_key = (self.primary_key and 1 or 2), self._order
 
     def __hash__(self):
-        return hash(self.name + '.' + self.model.__name__)
+        # Fields are used as dict keys throughout (defaults, refs, insert and
+        # update data), so hash the parts without building a new string.
+        return hash((self.name, self.model.__name__))
 
     def __repr__(self):
         if hasattr(self, 'model') and getattr(self, 'name', None):
@@ -4542,9 +4593,12 @@ class Field(ColumnBase):
         return '<%s: (unbound)>' % type(self).__name__
 
     def bind(self, model, name, set_attribute=True):
+        # Field names are used as keys for the instance data and dirty-field
+        # set on every attribute write, so intern them for faster lookups.
+        name = _intern(name)
         self.model = model
         self.name = self.safe_name = name
-        self.column_name = self.column_name or name
+        self.column_name = _intern(self.column_name or name)
         if set_attribute:
             setattr(model, name, self.accessor_class(model, self, name))
 
@@ -4691,14 +4745,18 @@ class DecimalField(Field):
         if not value:
             return value if value is None else D(0)
         if self.auto_round:
-            decimal_value = D(text_type(value))
-            return decimal_value.quantize(self._exp, rounding=self.rounding)
+            if not isinstance(value, D):
+                value = D(text_type(value))
+            return value.quantize(self._exp, rounding=self.rounding)
         return value
 
     def python_value(self, value):
         if value is not None:
             if isinstance(value, decimal.Decimal):
                 return value
+            elif isinstance(value, (int, long)):
+                # Integers convert exactly, floats must go through str().
+                return decimal.Decimal(value)
             return decimal.Decimal(text_type(value))
 
 
@@ -4763,10 +4821,10 @@ class BlobField(Field):
         return super(BlobField, self).bind(model, name, set_attribute)
 
     def db_value(self, value):
-        if isinstance(value, text_type):
-            value = value.encode('raw_unicode_escape')
         if isinstance(value, bytes_type):
             return self._constructor(value)
+        elif isinstance(value, text_type):
+            return self._constructor(value.encode('raw_unicode_escape'))
         return value
 
 
@@ -4851,6 +4909,8 @@ class BigBitFieldData(object):
 
 
 class BigBitFieldAccessor(FieldAccessor):
+    __slots__ = ()
+
     def __get__(self, instance, instance_type=None):
         if instance is None:
             return self.field
@@ -4887,7 +4947,9 @@ class UUIDField(Field):
     field_type = 'UUID'
 
     def db_value(self, value):
-        if isinstance(value, basestring) and len(value) == 32:
+        if value is None:
+            return
+        elif isinstance(value, basestring) and len(value) == 32:
             # Hex string. No transformation is necessary.
             return value
         elif isinstance(value, bytes) and len(value) == 16:
@@ -4937,13 +4999,44 @@ def _date_part(date_part):
         return self.model._meta.database.extract_date(date_part, self)
     return dec
 
+_numeric_date_directive = re.compile(r'%[dfHjmMSyY]')
+_digits_whitespace = re.compile(r'[\d\s]+')
+_format_literals = {}
+
+def _date_format_literals(fmt):
+    # Numeric directives only consume digits and whitespace, so for formats
+    # consisting solely of numeric directives, any value strptime() accepts
+    # has the same remaining characters as the format itself.
+    try:
+        return _format_literals[fmt]
+    except KeyError:
+        literals = _numeric_date_directive.sub('', fmt)
+        if '%' in literals:
+            literals = None  # Other directives, cannot be pre-checked.
+        else:
+            literals = _digits_whitespace.sub('', literals).lower()
+        _format_literals[fmt] = literals
+        return literals
+
 def format_date_time(value, formats, post_process=None):
     post_process = post_process or (lambda x: x)
+    value_literals = None
+    fallback = False
     for fmt in formats:
+        # The first format is tried as-is, since it usually matches. For the
+        # fallbacks, skip formats that cannot possibly match, rather than
+        # paying for the strptime() exception.
+        if fallback:
+            fmt_literals = _date_format_literals(fmt)
+            if fmt_literals is not None:
+                if value_literals is None:
+                    value_literals = _digits_whitespace.sub('', value).lower()
+                if value_literals != fmt_literals:
+                    continue
         try:
             return post_process(datetime.datetime.strptime(value, fmt))
         except ValueError:
-            pass
+            fallback = True
     return value
 
 def simple_date_time(value):
@@ -5068,6 +5161,10 @@ class TimestampField(BigIntegerField):
         self.ticks_to_microsecond = 1000000 // self.resolution
 
         self.utc = kwargs.pop('utc', False) or False
+        if self.utc:
+            self._from_timestamp = datetime.datetime.utcfromtimestamp
+        else:
+            self._from_timestamp = datetime.datetime.fromtimestamp
         dflt = datetime.datetime.utcnow if self.utc else datetime.datetime.now
         kwargs.setdefault('default', dflt)
         super(TimestampField, self).__init__(*args, **kwargs)
@@ -5119,11 +5216,7 @@ class TimestampField(BigIntegerField):
             else:
                 microseconds = 0
 
-            if self.utc:
-                value = datetime.datetime.utcfromtimestamp(value)
-            else:
-                value = datetime.datetime.fromtimestamp(value)
-
+            value = self._from_timestamp(value)
             if microseconds:
                 value = value.replace(microsecond=microseconds)
 
@@ -5142,14 +5235,16 @@ class TimestampField(BigIntegerField):
     second = property(_timestamp_date_part('second'))
 
 
+_ip_struct = struct.Struct('!I')
+
 class IPField(BigIntegerField):
     def db_value(self, val):
         if val is not None:
-            return struct.unpack('!I', socket.inet_aton(val))[0]
+            return _ip_struct.unpack(socket.inet_aton(val))[0]
 
     def python_value(self, val):
         if val is not None:
-            return socket.inet_ntoa(struct.pack('!I', val))
+            return socket.inet_ntoa(_ip_struct.pack(val))
 
 
 class BooleanField(Field):
@@ -5350,6 +5445,8 @@ class MetaField(Field):
 
 
 class ManyToManyFieldAccessor(FieldAccessor):
+    __slots__ = ('rel_model', 'through_model', 'src_fk', 'dest_fk')
+
     def __init__(self, model, field, name):
         super(ManyToManyFieldAccessor, self).__init__(model, field, name)
         self.model = field.model
@@ -5525,9 +5622,12 @@ class CompositeKey(MetaField):
             setattr(instance, self.field_names[idx], field_value)
 
     def __eq__(self, other):
-        expressions = [(self.model._meta.fields[field] == value)
-                       for field, value in zip(self.field_names, other)]
-        return reduce(operator.and_, expressions)
+        fields = self.model._meta.fields
+        expression = None
+        for field, value in zip(self.field_names, other):
+            clause = fields[field] == value
+            expression = clause if expression is None else expression & clause
+        return expression
 
     def __ne__(self, other):
         return ~(self == other)
@@ -5569,7 +5669,14 @@ class _SortedFieldList(object):
         return item in self._items[i:j]
 
     def index(self, field):
-        return self._keys.index(field._sort_key)
+        # Narrow the search to the run of matching sort keys, then compare by
+        # identity, as copies of inherited fields may share a sort key.
+        k = field._sort_key
+        i, j = bisect_left(self._keys, k), bisect_right(self._keys, k)
+        for idx in range(i, j):
+            if self._items[idx] is field:
+                return idx
+        raise ValueError('%r is not in list' % field)
 
     def insert(self, item):
         k = item._sort_key
@@ -5850,6 +5957,7 @@ class Metadata(object):
         self._default_dict = {}
         self._default_callables = {}
         self._default_callable_list = []
+        self._default_names = frozenset()
 
         self.name = model.__name__.lower()
         self.table_function = table_function
@@ -5901,22 +6009,30 @@ class Metadata(object):
 
         accum = [(None, self.model, None)]
         seen = set()
-        queue = collections.deque((self,))
-        method = queue.pop if depth_first else queue.popleft
+        if depth_first:
+            queue = [self]
+            method = queue.pop
+        else:
+            queue = collections.deque((self,))
+            method = queue.popleft
 
         while queue:
             curr = method()
             if curr in seen: continue
             seen.add(curr)
 
+            # Metadata that has already been visited would be skipped once
+            # popped, so avoid putting it on the queue at all.
             if refs:
                 for fk, model in curr.refs.items():
                     accum.append((fk, model, False))
-                    queue.append(model._meta)
+                    if model._meta not in seen:
+                        queue.append(model._meta)
             if backrefs:
                 for fk, model in curr.backrefs.items():
                     accum.append((fk, model, True))
-                    queue.append(model._meta)
+                    if model._meta not in seen:
+                        queue.append(model._meta)
 
         return accum
 
@@ -5986,7 +6102,8 @@ class Metadata(object):
         backrefs = self.model_backrefs.get(model, [])
         return (forwardrefs, backrefs)
 
-    def add_field(self, field_name, field, set_attribute=True):
+    def add_field(self, field_name, field, set_attribute=True,
+                  _defer_sort=False):
         if field_name in self.fields:
             self.remove_field(field_name)
         elif field_name in self.manytomany:
@@ -6001,7 +6118,8 @@ class Metadata(object):
             self.combined[field.column_name] = field
 
             self._sorted_field_list.insert(field)
-            self._update_sorted_fields()
+            if not _defer_sort:
+                self._update_sorted_fields()
 
             if field.default is not None:
                 # This optimization helps speed up model instance construction.
@@ -6013,6 +6131,7 @@ class Metadata(object):
                 else:
                     self._default_dict[field] = field.default
                     self._default_by_name[field.name] = field.default
+                self._default_names = self._default_names | set((field.name,))
         else:
             field.bind(self.model, field_name, set_attribute)
 
@@ -6046,6 +6165,7 @@ class Metadata(object):
             else:
                 self._default_dict.pop(original, None)
                 self._default_by_name.pop(original.name, None)
+            self._default_names = self._default_names - set((field_name,))
 
         if isinstance(original, ForeignKeyField):
             self.remove_ref(original)
@@ -6099,6 +6219,10 @@ class Metadata(object):
         return indexes
 
     def set_database(self, database):
+        if database is self.database and \
+           self.model._schema._database is database:
+            return  # Already bound, nothing to invalidate or re-apply.
+
         self.database = database
         self.model._schema._database = database
         del self.table
@@ -6204,8 +6328,11 @@ class ModelBase(type):
         if pk is not False:
             cls._meta.set_primary_key(pk_name, pk)
 
+        # Adding the fields in bulk, so just refresh the sorted field lists on
+        # the metadata once all fields have been added.
         for name, field in fields:
-            cls._meta.add_field(name, field)
+            cls._meta.add_field(name, field, _defer_sort=True)
+        cls._meta._update_sorted_fields()
 
         # Create a repr and error class before finalizing.
         if hasattr(cls, '__str__') and '__repr__' not in attrs:
@@ -6279,9 +6406,11 @@ class Model(with_metaclass(ModelBase, Node)):
     def __init__(self, *args, **kwargs):
         if kwargs.pop('__no_default__', None):
             self.__data__ = {}
+            self._dirty = set()
         else:
             self.__data__ = self._meta.get_default_dict()
-        self._dirty = set(self.__data__)
+            # Copying a frozenset is cheaper than rehashing the dict's keys.
+            self._dirty = set(self._meta._default_names)
         self.__rel__ = {}
 
         for k in kwargs:
@@ -6540,26 +6669,28 @@ class Model(with_metaclass(ModelBase, Node)):
         return new_data
 
     def _populate_unsaved_relations(self, field_dict):
-        for foreign_key_field in self._meta.refs:
-            foreign_key = foreign_key_field.name
+        # Only foreign-keys that have a related instance assigned can need
+        # populating, and those are exactly the keys of __rel__.
+        for foreign_key in list(self.__rel__):
             conditions = (
                 foreign_key in field_dict and
                 field_dict[foreign_key] is None and
-                self.__rel__.get(foreign_key) is not None)
+                self.__rel__[foreign_key] is not None)
             if conditions:
                 setattr(self, foreign_key, getattr(self, foreign_key))
                 field_dict[foreign_key] = self.__data__[foreign_key]
 
     def save(self, force_insert=False, only=None):
+        meta = self._meta
         field_dict = self.__data__.copy()
-        if self._meta.primary_key is not False:
-            pk_field = self._meta.primary_key
+        if meta.primary_key is not False:
+            pk_field = meta.primary_key
             pk_value = self._pk
         else:
             pk_field = pk_value = None
         if only is not None:
             field_dict = self._prune_fields(field_dict, only)
-        elif self._meta.only_save_dirty and not force_insert:
+        elif meta.only_save_dirty and not force_insert:
             field_dict = self._prune_fields(field_dict, self.dirty_fields)
             if not field_dict:
                 self._dirty.clear()
@@ -6568,11 +6699,11 @@ class Model(with_metaclass(ModelBase, Node)):
         self._populate_unsaved_relations(field_dict)
         rows = 1
 
-        if self._meta.auto_increment and pk_value is None:
+        if meta.auto_increment and pk_value is None:
             field_dict.pop(pk_field.name, None)
 
         if pk_value is not None and not force_insert:
-            if self._meta.composite_key:
+            if meta.composite_key:
                 for pk_part_name in pk_field.field_names:
                     field_dict.pop(pk_part_name, None)
             else:
@@ -6582,8 +6713,7 @@ class Model(with_metaclass(ModelBase, Node)):
             rows = self.update(**field_dict).where(self._pk_expr()).execute()
         elif pk_field is not None:
             pk = self.insert(**field_dict).execute()
-            if pk is not None and (self._meta.auto_increment or
-                                   pk_value is None):
+            if pk is not None and (meta.auto_increment or pk_value is None):
                 self._pk = pk
         else:
             self.insert(**field_dict).execute()
@@ -6634,10 +6764,10 @@ class Model(with_metaclass(ModelBase, Node)):
         return hash((self.__class__, self._pk))
 
     def __eq__(self, other):
-        return (
-            other.__class__ == self.__class__ and
-            self._pk is not None and
-            self._pk == other._pk)
+        if other.__class__ != self.__class__:
+            return False
+        pk = self._pk
+        return pk is not None and pk == other._pk
 
     def __ne__(self, other):
         return not self == other
@@ -6782,6 +6912,8 @@ class ModelAlias(Node):
             return ctx.sql(Entity(ctx.alias_manager[self]))
 
 
+_field_alias_classes = {}
+
 class FieldAlias(Field):
     def __init__(self, source, field):
         self.source = source
@@ -6790,9 +6922,13 @@ class FieldAlias(Field):
 
     @classmethod
     def create(cls, source, field):
-        class _FieldAlias(cls, type(field)):
-            pass
-        return _FieldAlias(source, field)
+        # Building a class is expensive, so only do it once per field type.
+        key = (cls, type(field))
+        if key not in _field_alias_classes:
+            class _FieldAlias(cls, type(field)):
+                pass
+            _field_alias_classes[key] = _FieldAlias
+        return _field_alias_classes[key](source, field)
 
     def clone(self):
         return FieldAlias(self.source, self.field)
@@ -6952,7 +7088,9 @@ class ModelCompoundSelectQuery(BaseModelSelect, CompoundSelectQuery):
 def _normalize_model_select(fields_or_models):
     fields = []
     for fm in fields_or_models:
-        if is_model(fm):
+        if isinstance(fm, Field):
+            fields.append(fm)  # Most common case, check it first.
+        elif is_model(fm):
             fields.extend(fm._meta.sorted_fields)
         elif isinstance(fm, ModelAlias):
             fields.extend(fm.get_field_aliases())
@@ -7174,9 +7312,9 @@ class ModelSelect(BaseModelSelect, Select):
         fks = (ForeignKeyField, BackrefAccessor)
         for key, value in sorted(qdict.items()):
             curr = self.model
-            if '__' in key and key.rsplit('__', 1)[1] in DJANGO_MAP:
-                key, op = key.rsplit('__', 1)
-                op = DJANGO_MAP[op]
+            prefix, sep, suffix = key.rpartition('__')
+            if sep and suffix in DJANGO_MAP:
+                key, op = prefix, DJANGO_MAP[suffix]
             elif value is None:
                 op = DJANGO_MAP['is']
             else:
@@ -7354,11 +7492,10 @@ class ManyToManyQuery(ModelSelect):
             value = ensure_tuple(value)
             if not value: return
 
-            inserts = [{
-                accessor.src_fk.name: src_id,
-                accessor.dest_fk.name: rel_id}
-                for rel_id in self._id_list(value)]
-            accessor.through_model.insert_many(inserts).execute()
+            inserts = [(src_id, rel_id) for rel_id in self._id_list(value)]
+            (accessor.through_model
+             .insert_many(inserts, fields=[accessor.src_fk, accessor.dest_fk])
+             .execute())
 
     def remove(self, value):
         src_id = getattr(self._instance, self._src_attr)
@@ -7400,6 +7537,8 @@ def safe_python_value(conv_func):
 
 
 class BaseModelCursorWrapper(DictCursorWrapper):
+    __slots__ = ('model', 'select', 'converters', 'fields')
+
     def __init__(self, cursor, model, columns):
         super(BaseModelCursorWrapper, self).__init__(cursor)
         self.model = model
@@ -7409,9 +7548,10 @@ class BaseModelCursorWrapper(DictCursorWrapper):
         combined = self.model._meta.combined
         table = self.model._meta.table
         description = self.cursor.description
+        select = self.select
 
-        self.ncols = len(self.cursor.description)
-        self.columns = []
+        self.ncols = len(description)
+        self.columns = columns = []
         self.converters = converters = [None] * self.ncols
         self.fields = fields = [None] * self.ncols
 
@@ -7422,9 +7562,9 @@ class BaseModelCursorWrapper(DictCursorWrapper):
                 column = column[dot_index + 1:]
 
             column = column.strip('")')
-            self.columns.append(column)
+            columns.append(column)
             try:
-                raw_node = self.select[idx]
+                raw_node = select[idx]
             except IndexError:
                 if column in combined:
                     raw_node = node = combined[column]
@@ -7441,7 +7581,7 @@ class BaseModelCursorWrapper(DictCursorWrapper):
                     converters[idx] = node.python_value
                 fields[idx] = node
                 if not raw_node.is_alias():
-                    self.columns[idx] = node.name
+                    columns[idx] = node.name
             elif isinstance(node, ColumnBase) and raw_node._converter:
                 converters[idx] = raw_node._converter
             elif isinstance(node, Function) and node._coerce:
@@ -7472,43 +7612,42 @@ class BaseModelCursorWrapper(DictCursorWrapper):
 
 
 class ModelDictCursorWrapper(BaseModelCursorWrapper):
+    __slots__ = ()
+
     def process_row(self, row):
         result = {}
-        columns, converters = self.columns, self.converters
-        fields = self.fields
-
-        for i in range(self.ncols):
-            attr = columns[i]
+        for attr, converter, value in zip(self.columns, self.converters, row):
             if attr in result: continue  # Don't overwrite if we have dupes.
-            if converters[i] is not None:
-                result[attr] = converters[i](row[i])
+            if converter is not None:
+                result[attr] = converter(value)
             else:
-                result[attr] = row[i]
+                result[attr] = value
 
         return result
 
 
 class ModelTupleCursorWrapper(ModelDictCursorWrapper):
+    __slots__ = ()
     constructor = tuple
 
     def process_row(self, row):
-        columns, converters = self.columns, self.converters
         return self.constructor([
-            (converters[i](row[i]) if converters[i] is not None else row[i])
-            for i in range(self.ncols)])
+            (converter(value) if converter is not None else value)
+            for converter, value in zip(self.converters, row)])
 
 
 class ModelNamedTupleCursorWrapper(ModelTupleCursorWrapper):
+    __slots__ = ('tuple_class', 'constructor')
+
     def initialize(self):
         self._initialize_columns()
-        attributes = []
-        for i in range(self.ncols):
-            attributes.append(self.columns[i])
-        self.tuple_class = collections.namedtuple('Row', attributes)
-        self.constructor = lambda row: self.tuple_class(*row)
+        self.tuple_class = _row_tuple_class(self.columns)
+        self.constructor = self.tuple_class._make
 
 
 class ModelObjectCursorWrapper(ModelDictCursorWrapper):
+    __slots__ = ('constructor', 'is_model')
+
     def __init__(self, cursor, model, select, constructor):
         self.constructor = constructor
         self.is_model = is_model(constructor)
@@ -7526,6 +7665,9 @@ class ModelObjectCursorWrapper(ModelDictCursorWrapper):
 
 
 class ModelCursorWrapper(BaseModelCursorWrapper):
+    __slots__ = ('from_list', 'joins', 'key_to_constructor', 'src_is_dest',
+                 'src_to_dest', 'column_keys')
+
     def __init__(self, cursor, model, select, from_list, joins):
         super(ModelCursorWrapper, self).__init__(cursor, model, select)
         self.from_list = from_list
@@ -7598,22 +7740,21 @@ class ModelCursorWrapper(BaseModelCursorWrapper):
         objects = {}
         object_list = []
         for key, constructor in self.key_to_constructor.items():
-            objects[key] = constructor(__no_default__=True)
-            object_list.append(objects[key])
+            objects[key] = instance = constructor(__no_default__=True)
+            object_list.append(instance)
 
         default_instance = objects[self.model]
 
         set_keys = set()
-        for idx, key in enumerate(self.column_keys):
+        cells = zip(self.column_keys, self.columns, self.converters, row)
+        for key, column, converter, value in cells:
             # Get the instance corresponding to the selected column/value,
             # falling back to the "root" model instance.
             instance = objects.get(key, default_instance)
-            column = self.columns[idx]
-            value = row[idx]
             if value is not None:
                 set_keys.add(key)
-            if self.converters[idx]:
-                value = self.converters[idx](value)
+            if converter:
+                value = converter(value)
 
             if isinstance(instance, dict):
                 instance[column] = value
@@ -7621,6 +7762,7 @@ class ModelCursorWrapper(BaseModelCursorWrapper):
                 setattr(instance, column, value)
 
         # Need to do some analysis on the joins before this.
+        src_is_dest = self.src_is_dest
         for (src, attr, dest, is_dict, join_type) in self.src_to_dest:
             instance = objects[src]
             try:
@@ -7631,13 +7773,14 @@ class ModelCursorWrapper(BaseModelCursorWrapper):
             # If no fields were set on the destination instance then do not
             # assign an "empty" instance.
             if instance is None or dest is None or \
-               (dest not in set_keys and not self.src_is_dest.get(dest)):
+               (dest not in set_keys and not src_is_dest.get(dest)):
                 continue
 
             # If no fields were set on either the source or the destination,
-            # then we have nothing to do here.
-            if instance not in set_keys and dest not in set_keys \
-               and join_type.endswith('OUTER JOIN'):
+            # then we have nothing to do here. The join type is checked first
+            # as it is cheaper than hashing the model instance.
+            if join_type.endswith('OUTER JOIN') and \
+               instance not in set_keys and dest not in set_keys:
                 continue
 
             if is_dict:
@@ -7655,6 +7798,8 @@ class ModelCursorWrapper(BaseModelCursorWrapper):
 
 class PrefetchQuery(collections.namedtuple('_PrefetchQuery', (
     'query', 'fields', 'is_backref', 'rel_models', 'field_to_name', 'model'))):
+    __slots__ = ()
+
     def __new__(cls, query, fields=None, is_backref=None, rel_models=None,
                 field_to_name=None, model=None):
         if fields:
@@ -7671,18 +7816,23 @@ class PrefetchQuery(collections.namedtuple('_PrefetchQuery', (
         return super(PrefetchQuery, cls).__new__(
             cls, query, fields, is_backref, rel_models, field_to_name, model)
 
+    # The id_map is a dict of field -> {identifier: instance(s)}, so that each
+    # row only needs a lookup on the identifier itself.
     def populate_instance(self, instance, id_map):
         if self.is_backref:
             for field in self.fields:
                 identifier = instance.__data__[field.name]
-                key = (field, identifier)
-                if key in id_map:
-                    setattr(instance, field.name, id_map[key])
+                field_map = id_map.get(field)
+                if field_map and identifier in field_map:
+                    setattr(instance, field.name, field_map[identifier])
         else:
             for field, attname in self.field_to_name:
                 identifier = instance.__data__[field.rel_field.name]
-                key = (field, identifier)
-                rel_instances = id_map.get(key, [])
+                field_map = id_map.get(field)
+                if field_map and identifier in field_map:
+                    rel_instances = field_map[identifier]
+                else:
+                    rel_instances = []
                 for inst in rel_instances:
                     setattr(inst, attname, instance)
                     inst._dirty.clear()
@@ -7691,12 +7841,16 @@ class PrefetchQuery(collections.namedtuple('_PrefetchQuery', (
     def store_instance(self, instance, id_map):
         for field, attname in self.field_to_name:
             identity = field.rel_field.python_value(instance.__data__[attname])
-            key = (field, identity)
+            try:
+                field_map = id_map[field]
+            except KeyError:
+                field_map = id_map[field] = {}
             if self.is_backref:
-                id_map[key] = instance
+                field_map[identity] = instance
+            elif identity in field_map:
+                field_map[identity].append(instance)
             else:
-                id_map.setdefault(key, [])
-                id_map[key].append(instance)
+                field_map[identity] = [instance]
 
 
 def prefetch_add_subquery(sq, subqueries):
@@ -7735,8 +7889,14 @@ def prefetch_add_subquery(sq, subqueries):
         dest = (target_model,) if target_model else None
 
         if fks:
+            # Foreign-keys usually all reference the same column, so build the
+            # subquery once per distinct primary-key and share it.
+            pk_subqueries = {}
+            for pk in pks:
+                if pk not in pk_subqueries:
+                    pk_subqueries[pk] = last_query.select(pk)
             expr = reduce(operator.or_, [
-                (fk << last_query.select(pk))
+                (fk << pk_subqueries[pk])
                 for (fk, pk) in zip(fks, pks)])
             subquery = subquery.where(expr)
             fixed_queries.append(PrefetchQuery(subquery, fks, False, dest))
@@ -7758,23 +7918,22 @@ def prefetch(sq, *subqueries):
 
     fixed_queries = prefetch_add_subquery(sq, subqueries)
     deps = {}
-    rel_map = {}
+    rel_map = collections.defaultdict(list)
     for pq in reversed(fixed_queries):
         query_model = pq.model
         if pq.fields:
             for rel_model in pq.rel_models:
-                rel_map.setdefault(rel_model, [])
                 rel_map[rel_model].append(pq)
 
-        deps.setdefault(query_model, {})
-        id_map = deps[query_model]
-        has_relations = bool(rel_map.get(query_model))
+        id_map = deps.setdefault(query_model, {})
+        store = pq.store_instance if pq.fields else None
+        populate = [(rel.populate_instance, deps[rel.model])
+                    for rel in rel_map.get(query_model, ())]
 
         for instance in pq.query:
-            if pq.fields:
-                pq.store_instance(instance, id_map)
-            if has_relations:
-                for rel in rel_map[query_model]:
-                    rel.populate_instance(instance, deps[rel.model])
+            if store is not None:
+                store(instance, id_map)
+            for populate_instance, rel_id_map in populate:
+                populate_instance(instance, rel_id_map)
 
     return list(pq.query)
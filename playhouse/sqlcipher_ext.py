@@ -68,7 +68,9 @@ class _SqlCipherDatabase(object):
         params = dict(self.connect_params)
         passphrase = params.pop('passphrase', '').replace("'", "''")
 
-        conn = sqlcipher.connect(self.database, isolation_level=None, **params)
+        conn = sqlcipher.connect(self.database,
+                                 isolation_level=self._isolation_level,
+                                 **params)
         try:
             if passphrase:
                 conn.execute("PRAGMA key='%s'" % passphrase)
@@ -58,6 +58,15 @@ class TestDatabase(DatabaseTestCase):
         self.assertEqual(self.database.timeout, 2.5)
         self.assertEqual(self.database.pragma('busy_timeout'), 2500)
 
+    def test_isolation_level(self):
+        db = SqliteDatabase(':memory:')
+        self.assertTrue(db.connection().isolation_level is None)
+        db.close()
+
+        db = SqliteDatabase(':memory:', isolation_level='DEFERRED')
+        self.assertEqual(db.connection().isolation_level, 'DEFERRED')
+        db.close()
+
     def test_pragmas_deferred(self):
         pragmas = (('journal_mode', 'wal'),)
         db = SqliteDatabase(None, pragmas=pragmas)
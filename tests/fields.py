@@ -7,6 +7,7 @@ from decimal import Decimal as D
 from decimal import ROUND_UP
 
 from peewee import bytes_type
+from peewee import format_date_time
 from peewee import NodeList
 from peewee import *
 
@@ -203,6 +204,21 @@ class TestDateFields(ModelTestCase):
         self.assertEqual(cdtm_db.date_time,
                          datetime.datetime(2003, 1, 2, 13, 37, 0))
 
+    def test_format_date_time(self):
+        formats = ['%Y-%m-%d %H:%M:%S.%f', '%Y-%m-%dT%H:%M:%S', '%Y-%m-%d',
+                   '%m/%d/%Y %I:%M %p']
+        for value, expected in (
+                ('2011-01-02 11:12:13.054321',
+                 datetime.datetime(2011, 1, 2, 11, 12, 13, 54321)),
+                ('2011-01-02T11:12:13',
+                 datetime.datetime(2011, 1, 2, 11, 12, 13)),
+                ('2011-01-02t11:12:13',
+                 datetime.datetime(2011, 1, 2, 11, 12, 13)),
+                ('2011-1-2', datetime.datetime(2011, 1, 2)),
+                ('01/02/2003 01:37 PM', datetime.datetime(2003, 1, 2, 13, 37)),
+                ('2011-01-02 11:12', '2011-01-02 11:12')):
+            self.assertEqual(format_date_time(value, formats), expected)
+
     def test_date_fields(self):
         dt1 = datetime.datetime(2011, 1, 2, 11, 12, 13, 54321)
         dt2 = datetime.datetime(2011, 1, 2, 11, 12, 13)
@@ -903,6 +919,9 @@ class TestUUIDField(ModelTestCase):
         self.assertEqual(u.id, u_db.id)
         self.assertEqual(u_db.data, uu)
 
+        # NULL values are passed through.
+        self.assertTrue(UUIDModel.data.db_value(None) is None)
+
     def test_binary_uuid_field(self):
         uu = uuid.uuid4()
         u = UUIDModel.create(bdata=uu)
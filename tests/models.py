@@ -1,3 +1,4 @@
+import copy
 import datetime
 import sys
 import time
@@ -1691,6 +1692,20 @@ class TestDefaultDirtyBehavior(ModelTestCase):
         ac_db = AutoCounter.get(AutoCounter.id == ac.id)
         self.assertEqual(ac_db.counter, 3)
 
+    def test_default_dirty_schema_change(self):
+        class Counter(TestModel):
+            control = IntegerField(default=1)
+
+        self.assertEqual(Counter().dirty_fields, [Counter.control])
+
+        Counter._meta.add_field('counter', IntegerField(default=incrementer()))
+        self.assertEqual(Counter().dirty_fields,
+                         [Counter.control, Counter.counter])
+
+        Counter._meta.remove_field('control')
+        self.assertEqual(Counter().dirty_fields, [Counter.counter])
+        self.assertEqual(Counter(__no_default__=1).dirty_fields, [])
+
 
 class TestDefaultValues(ModelTestCase):
     database = get_in_memory_db()
@@ -2911,6 +2926,44 @@ class TestModelGraph(BaseTestCase):
 
         self.assertTrue(User._meta.database is None)
 
+        # Re-binding to the same database leaves the metadata untouched.
+        User.bind(fake_db)
+        table = Tweet._meta.table
+        self.assertFalse(User.bind(fake_db))
+        self.assertTrue(Tweet._meta.table is table)
+
+        with User.bind_ctx(fake_db):
+            self.assertTrue(Tweet._meta.table is table)
+        self.assertTrue(Tweet._meta.database is fake_db)
+        self.assertTrue(Tweet._meta.table is table)
+
+        other_db = SqliteDatabase(None)
+        User.bind(other_db)
+        self.assertTrue(Tweet._meta.database is other_db)
+        self.assertFalse(Tweet._meta.table is table)
+
+    def test_bind_ctx_restore_shared_ref(self):
+        db_a, db_b, db_c = [SqliteDatabase(None) for _ in range(3)]
+        class B(Model):
+            class Meta:
+                database = db_c
+        class A(Model):
+            b = ForeignKeyField(B)
+            class Meta:
+                database = db_a
+        class C(Model):
+            b = ForeignKeyField(B)
+            class Meta:
+                database = db_b
+
+        # Models are restored in order, so the shared related model ends up
+        # bound to the database of the last model restored.
+        with db_a.bind_ctx([C, A]):
+            self.assertTrue(B._meta.database is db_a)
+        self.assertTrue(A._meta.database is db_a)
+        self.assertTrue(C._meta.database is db_b)
+        self.assertTrue(B._meta.database is db_a)
+
 
 class TestFieldInheritance(BaseTestCase):
     def test_field_inheritance(self):
@@ -2953,6 +3006,22 @@ class TestFieldInheritance(BaseTestCase):
 
         self.assertTrue(id(Photo.id) != id(Note.id))
 
+    def test_remove_field_shared_sort_key(self):
+        class BasePost(Model):
+            content = TextField()
+
+        class Post(BasePost):
+            pass
+
+        # A copy of a field has the same sort key as the original.
+        Post._meta.add_field('title', copy.deepcopy(Post.content))
+        self.assertEqual(Post._meta.sorted_field_names,
+                         ['id', 'title', 'content'])
+
+        Post._meta.remove_field('content')
+        self.assertEqual(Post._meta.sorted_field_names, ['id', 'title'])
+        self.assertEqual(Post._meta.sorted_fields, [Post.id, Post.title])
+
     def test_foreign_key_field_inheritance(self):
         class BaseModel(Model):
             class Meta:
@@ -3377,6 +3446,19 @@ class TestForeignKeyFieldDescriptors(BaseTestCase):
         self.assertEqual(T1.user.column_name, 'user')
         self.assertEqual(T1.user.object_id_name, 'user_id')
 
+    def test_str_subclass_names(self):
+        class S(str): pass
+
+        class T2(Model):
+            name = TextField(column_name=S('name_col'))
+
+        T2._meta.add_field(S('extra'), TextField())
+        self.assertEqual(T2.name.column_name, 'name_col')
+        self.assertEqual(T2.extra.name, 'extra')
+        self.assertEqual(T2._meta.sorted_field_names, ['id', 'name', 'extra'])
+        self.assertEqual(T2(name='n', extra='e').__data__,
+                         {'name': 'n', 'extra': 'e'})
+
 
 class TestModelAliasFieldProperties(ModelTestCase):
     database = get_in_memory_db()
@@ -3429,6 +3511,13 @@ class TestModelAliasFieldProperties(ModelTestCase):
                  .where(Person.dob.year == 1983))
         self.assertSQL(query, expected_sql, expected_params)
 
+        # Aliased fields of the same type share a single alias class.
+        self.assertTrue(type(Worker.dob) is type(Client.dob))
+        self.assertFalse(type(Worker.dob) is type(Worker.name))
+        self.assertTrue(isinstance(Worker.dob, DateField))
+        self.assertTrue(Worker.dob.source is Worker)
+        self.assertTrue(Client.dob.source is Client)
+
 
 class OnConflictTests(object):
     requires = [Emp]
@@ -55,6 +55,30 @@ class TestQueryExecution(DatabaseTestCase):
             {'content': 'meow', 'username': 'huey'},
             {'content': 'purr', 'username': 'huey'}])
 
+    def test_selection_duplicate_columns(self):
+        self.create_user_tweets('mickey')
+        huey_id = self.create_user_tweets('huey', 'meow')
+        query = (Tweet
+                 .select(Tweet.id, Tweet.content, User.id)
+                 .join(User, on=(Tweet.user_id == User.id)))
+        tweet_id, = [t_id for t_id, _, u_id in query.tuples()]
+        self.assertNotEqual(tweet_id, huey_id)
+
+        # The first "id" column is not overwritten by the second.
+        self.assertEqual(list(query.dicts()), [
+            {'id': tweet_id, 'content': 'meow'}])
+
+    def test_select_namedtuples(self):
+        self.create_user_tweets('huey', 'meow', 'purr')
+        query = Tweet.select(Tweet.id, Tweet.content).order_by(Tweet.id)
+        rows = list(query.namedtuples())
+        self.assertEqual([(row.id, row.content) for row in rows],
+                         [(1, 'meow'), (2, 'purr')])
+
+        # Row classes are re-used across queries with the same columns.
+        row = query.clone().namedtuples().get()
+        self.assertTrue(type(row) is type(rows[0]))
+
     def test_select_peek_first(self):
         huey_id = self.create_user_tweets('huey', 'meow', 'purr', 'hiss')
         query = Tweet.select(Tweet.content).order_by(Tweet.id)
@@ -174,6 +174,25 @@ class TestModelObjectCursorWrapper(ModelTestCase):
                 (2, 't2', 'u1'),
                 (3, 't3', 'u1')])
 
+    def test_model_namedtuples(self):
+        u = User.create(username='u1')
+        for i in range(2):
+            Tweet.create(user=u, content='t%d' % (i + 1))
+
+        query = (Tweet
+                 .select(Tweet.content, User.username)
+                 .join(User)
+                 .order_by(Tweet.id)
+                 .namedtuples())
+        rows = list(query)
+        self.assertEqual([(r.content, r.username) for r in rows], [
+            ('t1', 'u1'),
+            ('t2', 'u1')])
+
+        # Row classes are re-used across queries with the same columns.
+        row = query.clone().get()
+        self.assertTrue(type(row) is type(rows[0]))
+
 
 class Reg(TestModel):
     key = TextField()